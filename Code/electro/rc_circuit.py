@@ -1,4 +1,3 @@
-import math
 import numpy as np
 from liliutils.plotter import Plotter
 
@@ -19,13 +18,25 @@ class RCCircuit:
         self._resistance = resistance
         self.T = self._capacity * self._resistance
 
-    def transfer_function(self, p: complex) -> complex:
+    def transfer_function(self, p: complex | np.ndarray) -> complex | np.ndarray:
         """
         Transfer function of the circuit.
-        :param p: Laplace transform parameter.
+        :param p: Laplace transform parameter (a number or an array).
         :return: Value of the transfer_function
         """
-        return 1.0 / 1 + p * self.T
+        if isinstance(p, np.ndarray):
+            return np.reciprocal(1.0 + p * self.T)
+
+        return 1.0 / (1.0 + p * self.T)
+
+    def transfer_function_many(self, ps: np.ndarray) -> np.ndarray:
+        """
+        Transfer function of the circuit for an array of values of the Laplace transform parameter,
+        as required by the batched Laplace inverters.
+        :param ps: Values of the Laplace transform parameter.
+        :return: Array of values of the transfer_function
+        """
+        return np.reciprocal(1.0 + np.asarray(ps) * self.T)
 
     def steady_discharge(self, initial_voltage: float, t_fin: float, dt: float) -> None:
         """
@@ -36,10 +47,10 @@ class RCCircuit:
         :param dt: temporal step, s.
         :return: None
         """
-        values = []
-        for t in np.arange(0, t_fin + dt, dt):
-            V = initial_voltage * math.exp(-t / self.T)
-            values.append([t, V])
+        n = int(round(t_fin / dt)) + 1
+        values = np.empty((n, 2), dtype=np.float64)
+        values[:, 0] = np.linspace(0.0, t_fin, n)
+        values[:, 1] = initial_voltage * np.exp(-values[:, 0] * (1.0 / self.T))
 
         plotter = Plotter()
 
@@ -54,10 +65,10 @@ class RCCircuit:
                      size=(8, 6))
 
     def steady_recharge(self, external_voltage: float, t_fin: float, dt: float) -> None:
-        values = []
-        for t in np.arange(0, t_fin + dt, dt):
-            V = external_voltage * (1 - math.exp(-t / self.T))
-            values.append([t, V])
+        n = int(round(t_fin / dt)) + 1
+        values = np.empty((n, 2), dtype=np.float64)
+        values[:, 0] = np.linspace(0.0, t_fin, n)
+        values[:, 1] = external_voltage * -np.expm1(-values[:, 0] * (1.0 / self.T))
 
         plotter = Plotter()
 
@@ -1,16 +1,55 @@
 from dataclasses import dataclass, field
 
+import numpy as np
+
 @dataclass
 class Curve:
     """
-    Defines a curve object including data point pairs, the curve's label and color.
+    Defines a curve object including data points, the curve's label and color.
+    The abscissas and the ordinates of the points are kept in two separate arrays.
     """
-    values: list[tuple[float, float]] = field(default_factory=list)
+    xs: np.ndarray = field(default_factory=lambda: np.empty(0))
+    ys: np.ndarray = field(default_factory=lambda: np.empty(0))
     label: str = ''
     color: str = 'blue'
     kind: str  = 'line'   # supported: 'line', 'scatter'
     marker: str = '.'     # irrelevant if line
 
+    def __eq__(self, other) -> bool:
+        """
+        Compares the data points element-wise, since the generated __eq__ cannot compare arrays.
+        """
+        if not isinstance(other, Curve):
+            return NotImplemented
+
+        return (np.array_equal(self.xs, other.xs) and np.array_equal(self.ys, other.ys) and
+                (self.label, self.color, self.kind, self.marker) == (other.label, other.color, other.kind, other.marker))
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Data points as an (N, 2) array of rows (x, y); iterating over it yields the pairs as before.
+        """
+        return np.column_stack((self.xs, self.ys))
+
+    @values.setter
+    def values(self, pairs: list[tuple[float, float]] | np.ndarray):
+        points = np.asarray(pairs, dtype=np.float64).reshape(-1, 2)
+        self.xs = np.ascontiguousarray(points[:, 0])
+        self.ys = np.ascontiguousarray(points[:, 1])
+
+    @classmethod
+    def from_pairs(cls, pairs: list[tuple[float, float]], **kwargs) -> 'Curve':
+        """
+        Creates a curve from a list of data point pairs (x, y).
+        :param pairs:   The data point pairs.
+        :param kwargs:  Other attributes of the curve (label, color, kind, marker).
+        :return:        The curve.
+        """
+        curve = cls(**kwargs)
+        curve.values = pairs
+        return curve
+
 if __name__ == '__main__':
     curve = Curve()
     print(curve)
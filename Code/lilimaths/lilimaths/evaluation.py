@@ -0,0 +1,20 @@
+import numpy as np
+
+def evaluate(function: callable, x: np.ndarray, dtype: type = np.float64) -> np.ndarray:
+    """
+    Evaluates a function over an array of arguments:
+    in a single call if the function accepts NumPy arrays, element by element otherwise.
+    :param function:    The function to evaluate.
+    :param x:           The array of arguments.
+    :param dtype:       The type of the values of the function (e.g. np.float64 or np.complex128).
+    :return:            The array of values of the function, of the shape of x.
+    """
+    try:
+        values = np.asarray(function(x), dtype=dtype)
+    except (TypeError, ValueError):
+        values = None
+
+    if values is None or values.shape != x.shape:
+        values = np.fromiter((function(v) for v in x.ravel()), dtype=dtype, count=x.size).reshape(x.shape)
+
+    return values
@@ -2,107 +2,124 @@ import math
 import scipy
 import numpy as np
 from scipy.special import erfc, exp1, k0
-from numpy.polynomial import Polynomial
 from .constants import one_over_sqrt_pi
 
+HANTUSH_SERIES_LENGTH = 200     # maximal number of terms of the Hantush series
+
 #region Error functions
-def ierfc(x: float) -> float:
+def ierfc(x: float | np.ndarray) -> float | np.ndarray:
     """
     Repeated Integral of the Error function of real argument.
 	Definition: Abramowitz & Steagun 7.2    (http://www.math.sfu.ca/%7Ecbm/aands/page_299.htm)
 	Source:     Abramowitz & Steagun 7.2.1  (http://www.math.sfu.ca/%7Ecbm/aands/page_299.htm)
-    :param x:   Argument
+    :param x:   Argument (a number or an array)
     :return:    The value of ierfc.
     """
-    return one_over_sqrt_pi * math.exp(-x**2) - x * erfc(x)
+    return one_over_sqrt_pi * np.exp(-x * x) - x * erfc(x)
 
-def i2erfc(x: float) -> float:
+def i2erfc(x: float | np.ndarray) -> float | np.ndarray:
     """
     Doubly Repeated Integral of the Error function of real argument.
 	Definition: Abramowitz & Steagun 7.2    (http://www.math.sfu.ca/%7Ecbm/aands/page_299.htm)
 	Source:     Abramowitz & Steagun 7.2.1  (http://www.math.sfu.ca/%7Ecbm/aands/page_299.htm)
-    :param x:   Argument
+    :param x:   Argument (a number or an array)
     :return:    The value of i2erfc.
     """
-    return 0.25 * (erfc(x) - 2.0 * x * ierfc(x))
+    e = erfc(x)
+    return 0.25 * (e - 2.0 * x * (one_over_sqrt_pi * np.exp(-x * x) - x * e))
 
-def inerfc(x: float, n: int) -> float:
+def inerfc(x: float | np.ndarray, n: int) -> float | np.ndarray:
     """
     Repeated Integral of the Error function of real argument.
 	Definition: Abramowitz & Steagun 7.2    (http://www.math.sfu.ca/%7Ecbm/aands/page_299.htm)
 	Source:     Abramowitz & Steagun 7.2.1  (http://www.math.sfu.ca/%7Ecbm/aands/page_299.htm)
-    :param x:   Argument
+    :param x:   Argument (a number or an array)
     :param n:   Function Order
     :return:    The value of inerfc.
     """
-    match n:
-        case -1:
-            return one_over_sqrt_pi * math.exp(-x**2)
-        case 0:
-            return erfc(x)
-        case 1:
-            return ierfc(x)
-        case 2:
-            return i2erfc(x)
-        case _:
-            return (0.5 * inerfc(x, n - 2) - x * inerfc(x, n - 1)) / n
+    if n < -1:
+        raise ValueError(f"The order of inerfc is invalid: {n} (must be >= -1).")
+
+    if n == -1:
+        return one_over_sqrt_pi * np.exp(-x * x)
+
+    e = erfc(x)
+
+    if n == 0:
+        return e
+
+    # Forward recurrence A&S 7.2.5, started from erfc and ierfc.
+    previous, current = e, one_over_sqrt_pi * np.exp(-x * x) - x * e
+
+    for k in range(2, n + 1):
+        previous, current = current, (0.5 * previous - x * current) / k
+
+    return current
 #endregion
 
 #region Diffusion functions
-def cerfc(z: float, alpha: float) -> float:
+def cerfc(z: float | np.ndarray, alpha: float) -> float | np.ndarray:
     """
     Diffusion cosine, or Hantush's first depletion function.
 	Source: Hantush, M.S., "Nonsteady Flow to Flowing Wells in Leaky Aquifers." Jour. Geophys. Res., 64, 8, 1043-1052. 1959.
-    :param z:       Argument
+    :param z:       Argument (a number or an array)
     :param alpha:   Parameter
     :return:        The value of cerfc
     """
-    if abs(z) < np.finfo(float).eps:
-        return math.exp(-alpha)
+    z = np.asarray(z, dtype=np.float64)
+    e_neg = np.exp(-alpha)
+    e_pos = np.exp(alpha)
+
+    small = np.abs(z) < np.finfo(float).eps
+    shift = np.divide(0.5 * alpha, z, out=np.zeros_like(z), where=~small)
 
-    argument = z - 0.5 * alpha / z
-    result = math.exp(-alpha) * erfc(argument)
+    result = 0.5 * (e_neg * erfc(z - shift) + e_pos * erfc(z + shift))
 
-    argument = z + 0.5 * alpha / z
-    result += math.exp(alpha) * erfc(argument)
-    result /= 2.0
-    return result
+    return np.where(small, e_neg, result)[()]
 
-def serfc(z: float, alpha: float) -> float:
+def serfc(z: float | np.ndarray, alpha: float) -> float | np.ndarray:
     """
     Diffusion sine, or Hantush's second depletion function.
 	Source: Hantush, M. S., "Nonsteady Flow to Flowing Wells in Leaky Aquifers." Jour. Geophys. Res., 64, 8, 1043-1052. 1959.
-    :param z:       Argument
+    :param z:       Argument (a number or an array)
     :param alpha:   Parameter
     :return:        The value of serfc
     """
-    if abs(z) < np.finfo(float).eps:
-        return math.exp(-alpha)
+    z = np.asarray(z, dtype=np.float64)
+    e_neg = np.exp(-alpha)
+    e_pos = np.exp(alpha)
 
-    argument = z + 0.5 * alpha / z
-    result = math.exp(-alpha) * erfc(argument)
+    small = np.abs(z) < np.finfo(float).eps
+    shift = np.divide(0.5 * alpha, z, out=np.zeros_like(z), where=~small)
 
-    argument = z + 0.5 * alpha / z
-    result += math.exp(alpha) * erfc(argument)
-    result /= 2.0
-    return result
+    result = 0.5 * (e_neg * erfc(z - shift) - e_pos * erfc(z + shift))
 
-def aerfc(z: float, alpha: float) -> float:
+    return np.where(small, e_neg, result)[()]
+
+def aerfc(z: float | np.ndarray, alpha: float) -> float | np.ndarray:
     """
     "aerreal" error function. Called so because it occurs in calculations for linear and areal water intakes
     in leaky and non-leaky homogeneous aquifers.
 	Inverse Laplace transform of exp(-z * sqrt(p/a + g^2)) / (p (p/a + g^2)) is
 	(1/g^2) * aerfc(z/2 sqrt(at), g * z).
-    :param z:       Argument
+    :param z:       Argument (a number or an array)
     :param alpha:   Parameter
     :return:        The value of aerfc.
     """
-    return cerfc(z, alpha) - math.exp(-0.25 * alpha**2 / (z**2)) * erfc(z)
+    z = np.asarray(z, dtype=np.float64)
+
+    small = np.abs(z) < np.finfo(float).eps
+    exponent = np.divide(-0.25 * alpha**2, z**2, out=np.zeros_like(z), where=~small)
+
+    # The limit z -> 0 of the damping factor: 0, or 1 when alpha = 0.
+    damping = np.where(small, 1.0 if alpha == 0 else 0.0, np.exp(exponent))
+
+    return (cerfc(z, alpha) - damping * erfc(z))[()]
 #endregion
 
 #region Hantushian
 def hantush(z: float, u: float) -> float:
-    if z < np.finfo(np.float32):
+    if abs(z) < np.finfo(np.float32).eps:
         return (1.0 / (2 * math.pi)) * k0(math.sqrt(u))
     elif abs(z) < abs(u / (4.0 * z)):
         return (1.0 / (2 * math.pi)) * k0(math.sqrt(u)) - _hantush_series(z, u / (4.0 * z))
@@ -122,25 +139,34 @@ def _hantush_series(p: float, q: float) -> float:
     if q <= 0:
         return float('inf')
 
-    result = 0.0
-    factor = 1.0
-    n = 0
+    eq = math.exp(-q)
+    n = np.arange(HANTUSH_SERIES_LENGTH)
+
+    factors = np.empty(HANTUSH_SERIES_LENGTH)
+    factors[0] = 1.0
+    factors[1:] = np.cumprod(-p / n[1:])
+
+    E1 = exp1(q)
+    epsilon = min(np.finfo(np.float32).eps, math.exp(-p) * E1)
+
+    # E_{n+1}(q) <= exp(-q) / (q + n) (A&S 5.1.19), so no term beyond the first bound under epsilon is needed.
+    bounded = np.abs(factors) * eq / (q + n) <= epsilon
+    length = int(np.argmax(bounded)) + 1 if bounded.any() else HANTUSH_SERIES_LENGTH
 
-    E = exp1(q)
-    term = float('inf')
-    epsilon = min(np.finfo(np.float32), math.exp(-p) * E)
+    # E_{n+1}(q) by the upward recurrence.
+    E = np.empty(length)
+    E[0] = E1
 
-    while abs(term) > epsilon:
-        term = factor * E
-        result += term
+    for k in range(1, length):
+        E[k] = (eq - q * E[k - 1]) / k
 
-        n += 1
-        factor = -factor * p / n
-        E = (math.exp(-q) - q * E) / n
+    terms = factors[:length] * E
 
-    result /= (4 * math.pi)
+    # The series is summed up to (and including) the first term not exceeding epsilon.
+    converged = np.abs(terms) <= epsilon
+    count = int(np.argmax(converged)) + 1 if converged.any() else length
 
-    return result
+    return float(terms[:count].sum()) / (4 * math.pi)
 #endregion
 
 if __name__ == '__main__':
@@ -2,6 +2,8 @@ import math
 import numpy as np
 import numpy.fft
 
+from lilimaths.evaluation import evaluate
+
 """
 Iseger's coefficients for the three supported numbers of integration nodes: 16, 32, 48.
 In the pair (alpha, lambda) alpha is the abscissa of the node, lambda its weight in the summation.
@@ -64,6 +66,14 @@ ISEGER_COEFFICIENTS_48 = [
     (476.4483318696360, 1494.71066227687),
 ]
 
+_ISEGER_COEFFICIENTS = {16: ISEGER_COEFFICIENTS_16, 32: ISEGER_COEFFICIENTS_32, 48: ISEGER_COEFFICIENTS_48}
+
+"""
+The same coefficients as contiguous arrays of alphas and lambdas, by the number of integration nodes.
+"""
+ISEGER_ALPHAS = {n: np.array([c[0] for c in table], dtype=np.float64) for n, table in _ISEGER_COEFFICIENTS.items()}
+ISEGER_LAMBDAS = {n: np.array([c[1] for c in table], dtype=np.float64) for n, table in _ISEGER_COEFFICIENTS.items()}
+
 def invert \
         (
                 laplace_image: callable,
@@ -76,6 +86,8 @@ def invert \
     Computes the values of the Laplace original for a given Laplace image
     and a sequence of values of the time argument with given step.
     :param laplace_image:       The Laplace image, F(z: complex) -> complex.
+                                If it accepts NumPy arrays, it is evaluated once for all the nodes;
+                                otherwise it is evaluated node by node.
     :param delta_t:             The time step for the values of original.
     :param number_of_values:    The number of output values of the original,
                                 should be a power of 2.
@@ -84,7 +96,7 @@ def invert \
                                 such that c is greater than the real part of all singularities
                                 of the  Laplace image (https://en.wikipedia.org/wiki/Inverse_Laplace_transform).
     :param quadrature_degree:   The degree of Gauss quadrature (supported values are 16, 32, 48).
-    :return:                    Array of values of the original function in points k * deltaT, k = 0, ..., m.
+    :return:                    Array of values of the original function in points k * deltaT, k = 0, ..., number_of_values.
     """
     if delta_t <= 0:
         raise ArithmeticError(f"The value of time step is invalid: {delta_t}.")
@@ -95,7 +107,6 @@ def invert \
     if quadrature_degree not in [16, 32, 48]:
         raise ValueError(f"The number of quadrature nodes {quadrature_degree} is not supported. Must be 16, 32, or 48.")
 
-    m = number_of_values
     mm = 2
 
     while mm <= number_of_values:
@@ -107,47 +118,44 @@ def invert \
     number_of_values = mm
     m2 = 8 * number_of_values
     b = 44.0 / m2
-    coefficients = ISEGER_COEFFICIENTS_16
-
-    match quadrature_degree:
-        case 32:
-            coefficients = ISEGER_COEFFICIENTS_32
-        case 48:
-            coefficients = ISEGER_COEFFICIENTS_48
+    alphas = ISEGER_ALPHAS[quadrature_degree]
+    lambdas = ISEGER_LAMBDAS[quadrature_degree]
 
-    y = [0.0] * (m + 1)
+    # All the nodes at once: a row per k = 0, ..., m2, a column per quadrature node.
+    # The real part is the same for all the nodes; the complex array is filled in place, part by part.
+    k = np.arange(m2 + 1)[:, None]
+    two_pi_over_m2 = 2.0 * math.pi / m2
 
-    image_values = [0 + 0j] * (m2 + 1)
+    z = np.empty((m2 + 1, lambdas.shape[0]), dtype=np.complex128)
+    z.real = critical_abscissa + b / delta_t
+    z.imag = (lambdas[None, :] + two_pi_over_m2 * k) / delta_t
 
-    for k in range(m2 + 1):
-        sum = 0
-
-        for j in range(int(quadrature_degree / 2)):
-            z = b + (0 + 1j) * (coefficients[j][1] + 2.0 * math.pi * k / m2)
-            z = critical_abscissa + z / delta_t
-            sum += coefficients[j][0] * laplace_image(z).real
-
-        image_values[k] = 2.0 * sum / delta_t
+    image_values = (2.0 / delta_t) * (evaluate(laplace_image, z, np.complex128).real @ alphas)
 
     image_values[0] = (image_values[0] + image_values[m2]) / 2.0
 
-    inverse_fft = numpy.fft.ifft(image_values[:m2]) * (m2 / 2)
+    # The image values are real, so only the real part of their inverse DFT is needed:
+    # it is the inverse real FFT of the half spectrum symmetrized as (x[k] + x[m2 - k]) / 2.
+    m_half = m2 // 2
+    spectrum = np.empty(m_half + 1, dtype=np.float64)
+    spectrum[0] = image_values[0]
+    spectrum[1:m_half] = 0.5 * (image_values[1:m_half] + image_values[m2 - 1:m_half:-1])
+    spectrum[m_half] = image_values[m_half]
 
-    m4 = int(m2 / 4)
+    inverse_fft = numpy.fft.irfft(spectrum, n=m2) * (m2 / 2)
 
-    result = [0.0] * number_of_values
+    m4 = int(m2 / 4)
 
-    for j in range(number_of_values):
-        exp_arg = b * j
+    j = np.arange(number_of_values)
+    exp_arg = b * j
 
-        if critical_abscissa > 0:
-            exp_arg += critical_abscissa * (j * delta_t)
+    if critical_abscissa > 0:
+        exp_arg = exp_arg + critical_abscissa * (j * delta_t)
 
-        result[j] = inverse_fft[j].real * math.exp(exp_arg) / m4
+    result = inverse_fft[:number_of_values] * np.exp(exp_arg) / m4
 
     return result
 
-
 if __name__ == '__main__':
     def image(p: complex) -> complex:
         return 1.0 / (1 + p)
@@ -158,10 +166,11 @@ if __name__ == '__main__':
 
     print(result)
 
-    for i in range(number_of_values + 1):
-        iseg = result[i]
-        exact = math.exp(- i * delta_t)
-        diff = abs(iseg - exact)
-        percent = diff * 100
+    ts = delta_t * np.arange(number_of_values + 1)
+    isegs = result[:number_of_values + 1]
+    exacts = np.exp(-ts)
+    diffs = np.abs(isegs - exacts)
+    percents = diffs * 100
 
-        print(f"t={i * delta_t:0.1}\tiseg={iseg}\texact={exact}\tdiff={diff}\tpercent={percent}")
+    for t, iseg, exact, diff, percent in zip(ts, isegs, exacts, diffs, percents):
+        print(f"t={t:0.1}\tiseg={iseg}\texact={exact}\tdiff={diff}\tpercent={percent}")
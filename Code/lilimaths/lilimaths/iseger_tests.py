@@ -1,11 +1,9 @@
-from math import exp, sin, pi, sqrt
-import cmath
-
 import numpy as np
 import scipy.special
 
 from curve import Curve
 from deviations import Deviations
+from evaluation import evaluate
 from iseger import invert
 from liliutils.plotter2 import Plotter
 
@@ -18,40 +16,31 @@ def test_context(image: callable, expected: callable, dt: float, number_of_point
     Creates a series of percentual approximation error with different values of N and puts them to a graph.
     @param image:       Laplace image F(p), p: float
     @param orders:      List of values of integration order (each of which must be even)
-    @param expected:    Expected (exact) original: Float-> float
+    @param expected:    Expected (exact) original: Float-> float, preferably accepting NumPy arrays
     @param t_fin:       Final time
     @param dt:          Time step.
     @return:            None.
     """
 
     curves = list[Curve]()
-    inverted = invert(image, dt, number_of_points, critical_abscissa, quadrature_order)
-
-    max_difference = 0
-    values = []
-    for i in range(len(inverted)):
-        inverted_value = inverted[i]
-        exact_value = expected(dt * i)
-        values.append((i * dt, inverted_value))
+    inverted = np.asarray(invert(image, dt, number_of_points, critical_abscissa, quadrature_order))
+    ts = dt * np.arange(len(inverted))
 
-        difference = abs(inverted_value - exact_value)
-        if difference > max_difference:
-            max_difference = difference
+    exact = evaluate(expected, ts)
+    max_difference = float(np.max(np.abs(inverted - exact)))
 
     curve = Curve()
-    curve.values = values
+    curve.xs = ts
+    curve.ys = inverted
     curve.label = "den Iseger"
     curve.color = 'blue'
     curve.kind = 'scatter'
 
     curves.append(curve)
 
-    values = []
-    for i in range(len(curve.values) + 1):
-        values.append((dt * i, expected(dt * i)))
-
     exact_curve = Curve()
-    exact_curve.values  = values
+    exact_curve.xs      = ts
+    exact_curve.ys      = exact
     exact_curve.label   = "Exact"
     exact_curve.color   = COLORS[0]
 
@@ -69,19 +58,19 @@ if __name__ == '__main__':
         return 1 / (1 + p)
 
     def exponent_original(t: float) -> float:
-        return exp(-t)
+        return np.exp(-t)
 
     def sine_image(p: complex) -> complex:
         return 1 / (1 + p**2)
 
     def sine_original(t: float) -> float:
-        return sin(t)
+        return np.sin(t)
 
     def damped_sine_image(p: complex) -> complex:
         return 1 / (1 + (p + 0.2)**2)
 
     def damped_sine_original(t: float) -> float:
-        return exp(-0.2 * t) * sin(t)
+        return np.exp(-0.2 * t) * np.sin(t)
 
     def linear_image(p: complex) -> complex:
         return 1 / p**2
@@ -93,39 +82,39 @@ if __name__ == '__main__':
         return 1 / (p + 1)**2
 
     def exponent_multiplied_original(t: float) -> float:
-        return t * exp(-t)
+        return t * np.exp(-t)
 
     def rectangular_wave_image(p: complex) -> complex:
-        return cmath.exp(-p) / p
+        return np.exp(-p) / p
 
     def rectangular_wave_origin(t: float) -> float:
-        return 0 if t <= 1 else 1
+        return np.where(t <= 1, 0.0, 1.0)
 
     def rectangular_wave2_origin(t: complex) -> complex:
-        return 1 if 1 <= t <= 2 else 0
+        return np.where((1 <= t) & (t <= 2), 1.0, 0.0)
 
     def rectangular_wave2_image(p: float) -> float:
-        return (cmath.exp(-p) - cmath.exp(-(p * 2)))/ p
+        return (np.exp(-p) - np.exp(-(p * 2)))/ p
 
     k = 0.8
     def k0_image(p: complex) -> complex:
-        return (1 / p) * scipy.special.kv(0, 2 * cmath.sqrt(k * p))
+        return (1 / p) * scipy.special.kv(0, 2 * np.sqrt(k * p))
 
     def k0_original(t: float) -> float:
-        return 0.5 * scipy.special.exp1(k / (t + 0.0001))
+        return 0.5 * scipy.special.exp1(k / (t + np.finfo(float).eps))
 
     a = -0.1
     def exponential_growth_image(p: complex) -> complex:
         return (1 / p) * (1 /(p + a))
 
     def exponential_growth_original(t: float) -> float:
-        return (1 / a) * (1 - exp(- a * t))
+        return -np.expm1(-a * t) / a
 
     def exponential_growth_integrated_image(p: complex) -> complex:
         return (1 / p**2) * (1 /(p + a))
 
     def exponential_growth_original_integrated(t: float) -> float:
-        return (t / a) - (1 / a**2) * (1 - exp(- a * t))
+        return t / a + np.expm1(-a * t) / (a * a)
 
     images              = [
                             exponent_image,
@@ -1,4 +1,35 @@
 import math
+from functools import lru_cache
+
+import numpy as np
+
+from lilimaths.evaluation import evaluate
+
+try:
+    from numba import njit
+    from numba.core.dispatcher import Dispatcher
+
+    def is_jitted(function) -> bool:
+        """
+        Tells whether the function is compiled by Numba.
+        Unlike numba.extending.is_jitted, does not re-import the dispatcher type on every call.
+        """
+        return isinstance(function, Dispatcher)
+except ImportError:
+    def is_jitted(function) -> bool:
+        """
+        Stand-in for is_jitted when Numba is not installed: no function is compiled.
+        """
+        return False
+
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit when Numba is not installed: leaves the function as it is.
+        """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        return lambda function: function
 
 FAIRS_OPTIMUM_ORDER = 14
 
@@ -9,6 +40,8 @@ class Stehfest:
 	Code for the Initialize() and InverseTransform() routines borrowed creatively from Walt Fair's example
 	(http://www.codeproject.com/Articles/25189/Numerical-Laplace-Transforms-and-Inverse-Transform).
     """
+    __slots__ = ('_order', '_coefficients', '_nodes', '_terms')
+
     def __init__(self, order: int = FAIRS_OPTIMUM_ORDER):
         """
         Order constructor.
@@ -16,7 +49,9 @@ class Stehfest:
         :param order:   Inversion order (recommended: as a rule, not more than 12..16).
         """
         self._order = order
-        self._initialize()
+        self._coefficients = _stehfest_coeffs(order)
+        self._nodes = _stehfest_nodes(order)
+        self._terms = _stehfest_terms(order)
 
     @property
     def coefficients(self):
@@ -26,51 +61,114 @@ class Stehfest:
         """
         Calculates the value of the original by inverting the Laplace image.
         :param image:   Function calculating the Laplace image.
+                        If it is compiled by Numba (@njit), the whole sum runs in compiled code.
         :param t:       Value of time.
         :return:        Approximation  to the value of the original with the given value of time.
         """
+        if is_jitted(image):
+            return _stehfest_invert_kernel(self._coefficients, image, t)
+
+        # A handful of nodes only: a plain sum beats building and probing an array per value of time.
         ln2t = math.log(2) / t
-        x = 0
-        y = 0
+        y = 0.0
 
-        for i in range(len(self._coefficients)):
-            x += ln2t
-            y += self._coefficients[i] * image(x)
+        for node, coefficient in self._terms:
+            y += coefficient * image(node * ln2t)
 
         return ln2t * y
 
-    #region Protected Auxiliary
-    def _initialize(self):
+    def invert_many(self, image: callable, ts: float | np.ndarray) -> float | np.ndarray:
         """
-        Initialization of the Stehfest's coefficients.
-        Borrowed from Walt Fair.
-        :return: None.
+        Calculates the values of the original for an array of values of time at once.
+        :param image:   Function calculating the Laplace image.
+                        If it accepts NumPy arrays, it is evaluated once for all the nodes and all the values of time;
+                        otherwise it is evaluated node by node.
+        :param ts:      Values of time (a number or an array).
+        :return:        Approximations to the values of the original, of the shape of ts (a number for a number).
         """
-        N2 = int(self._order / 2)
-        NV = int(2 * N2)
+        ts = np.asarray(ts, dtype=np.float64)
+        t = ts.ravel()
 
-        self._coefficients  = [0.0] * NV
+        if is_jitted(image):
+            values = np.array([_stehfest_invert_kernel(self._coefficients, image, t_i) for t_i in t])
+        else:
+            ln2t = math.log(2) / t
+            X = ln2t[:, None] * self._nodes[None, :]
+            values = ln2t * (evaluate(image, X) @ self._coefficients)
 
-        sign = 1
-        if (N2 % 2) != 0:
-            sign = -1
+        return values.reshape(ts.shape)[()]
 
-        for i in range(NV):
-            kmin = int((i + 2) / 2)
-            kmax = i + 1
-            if kmax > N2:
-                kmax = N2
+#region Protected Auxiliary
+@lru_cache(maxsize=32)
+def _stehfest_coeffs(order: int) -> np.ndarray:
+    """
+    Calculates the Stehfest's coefficients for the given order.
+    Borrowed from Walt Fair. Cached per order, so that repeated constructions of Stehfest are cheap.
+    :param order:   Inversion order.
+    :return:        Array of the coefficients, read-only since it is shared by all instances of the same order.
+    """
+    N2 = int(order / 2)
+    NV = 2 * N2
+
+    # 0!, 1!, ..., (2 N2 + 1)! in floating point, with no big integers formed.
+    fact = np.cumprod(np.concatenate(([1.0], np.arange(1, 2 * N2 + 2, dtype=np.float64))))
+    kpow = np.array([k**N2 for k in range(N2 + 1)], dtype=np.float64)
+
+    # The whole triangle of terms at once: a row per coefficient i, a column per k = 1, ..., N2.
+    i = np.arange(NV)[:, None]
+    k = np.arange(1, N2 + 1)[None, :]
+    valid = ((i + 2) // 2 <= k) & (k <= np.minimum(i + 1, N2))
+
+    # Outside the triangle the factorial indices may be negative; those terms are dropped anyway.
+    terms = (kpow[k] * fact[2 * k]) / (fact[k] * fact[np.maximum(2 * k - i - 1, 0)] * fact[N2 - k] *
+                                       fact[k - 1] * fact[np.maximum(i + 1 - k, 0)])
 
-            sign = -sign
+    # (-1)^(N2 + i + 1)
+    signs = np.where((N2 + np.arange(NV)) % 2 != 0, 1.0, -1.0)
 
-            for k in range(kmin, kmax + 1):
-                self._coefficients[i] = (self._coefficients[i] + (math.pow(k, N2) / math.factorial(k)) *
-                                         (math.factorial(2 * k) / math.factorial(2 * k - i - 1)) /
-                                         math.factorial(N2 - k) / math.factorial(k - 1) / math.factorial(i + 1 - k))
+    coefficients = signs * np.where(valid, terms, 0.0).sum(axis=1)
+    coefficients.flags.writeable = False
+
+    return coefficients
+
+@lru_cache(maxsize=32)
+def _stehfest_nodes(order: int) -> np.ndarray:
+    """
+    Multipliers of ln(2) / t giving the Stehfest's nodes: 1, 2, ..., N.
+    :param order:   Inversion order.
+    :return:        Array of the multipliers, read-only since it is shared by all instances of the same order.
+    """
+    nodes = np.arange(1, _stehfest_coeffs(order).shape[0] + 1, dtype=np.float64)
+    nodes.flags.writeable = False
+
+    return nodes
+
+@lru_cache(maxsize=32)
+def _stehfest_terms(order: int) -> tuple[tuple[float, float], ...]:
+    """
+    Pairs (node multiplier, coefficient) as plain floats, for the sum over the nodes in Python.
+    :param order:   Inversion order.
+    :return:        Tuple of the pairs.
+    """
+    return tuple(zip(_stehfest_nodes(order).tolist(), _stehfest_coeffs(order).tolist()))
+
+@njit
+def _stehfest_invert_kernel(coefficients: np.ndarray, image: callable, t: float) -> float:
+    """
+    The Stehfest's sum for an image compiled by Numba.
+    :param coefficients:    The Stehfest's coefficients.
+    :param image:           Function calculating the Laplace image, compiled by Numba.
+    :param t:               Value of time.
+    :return:                Approximation  to the value of the original with the given value of time.
+    """
+    ln2t = math.log(2) / t
+    y = 0.0
 
-            self._coefficients[i] = sign * self._coefficients[i]
+    for i in range(coefficients.shape[0]):
+        y += coefficients[i] * image((i + 1) * ln2t)
 
-    #endregion
+    return ln2t * y
+#endregion
 
 if __name__ == '__main__':
     import pandas as pd
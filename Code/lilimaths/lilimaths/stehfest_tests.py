@@ -1,10 +1,9 @@
-from math import exp, sin, pi, sqrt
-
 import numpy as np
 import scipy.special
 
 from curve import Curve
 from deviations import Deviations
+from evaluation import evaluate
 from stehfest import Stehfest
 from liliutils.plotter2 import Plotter
 
@@ -15,50 +14,50 @@ def test_context(image: callable, orders: list[int], expected: callable, t_fin:
     Tests Stehfest's method for an image-original pair.
     Creates a series of approximate originals with different values of N against the exact original and puts them to a graph.
     Creates a series of percentual approximation error with different values of N and puts them to a graph.
-    @param image:       Laplace image F(p), p: float
+    @param image:       Laplace image F(p), p: float, preferably accepting NumPy arrays
     @param orders:      List of values of integration order (each of which must be even)
-    @param expected:    Expected (exact) original: Float-> float
+    @param expected:    Expected (exact) original: Float-> float, preferably accepting NumPy arrays
     @param t_fin:       Final time
     @param dt:          Time step.
     @return:            None.
     """
     curves = list[Curve]()
-    values = []
 
-    for t in np.arange(dt, t_fin + dt, dt):
-        values.append((t, expected(t)))
+    n = int(round((t_fin - dt) / dt)) + 1
+    ts = np.linspace(dt, t_fin, n)
 
     exact_curve = Curve()
-    exact_curve.values  = values
+    exact_curve.xs      = ts
+    exact_curve.ys      = evaluate(expected, ts)
     exact_curve.label   = "Exact"
     exact_curve.color   = COLORS[0]
 
     curves.append(exact_curve)
 
+    coarse_n = int(round((t_fin - dt) / (5 * dt))) + 1
+    coarse_ts = np.linspace(dt, t_fin, coarse_n)
+    coarse_exact = evaluate(expected, coarse_ts)
+
     deviations = Deviations()
     color_index = 1
     for N in orders:
         sf = Stehfest(N)
-        values = []
 
         deviations.values[N] = [0, 0, 0]
 
-        for t in np.arange(dt, t_fin + 5 * dt, 5 * dt):
-            calculated = sf.invert(image, t)
-            exact = expected(t)
-
-            values.append((t, calculated))
+        calculated = sf.invert_many(image, coarse_ts)
 
-            deviation = abs(exact - calculated)
-            percent = (deviation / exact) * 100
+        deviation = np.abs(coarse_exact - calculated)
+        i = int(np.argmax(deviation))
 
-            if deviation > deviations.values[N][1]:
-                deviations.values[N][0] = t
-                deviations.values[N][1] = deviation
-                deviations.values[N][2] = percent
+        if deviation[i] > 0:
+            deviations.values[N][0] = coarse_ts[i]
+            deviations.values[N][1] = deviation[i]
+            deviations.values[N][2] = (deviation[i] / coarse_exact[i]) * 100
 
         curve = Curve()
-        curve.values = values
+        curve.xs = coarse_ts
+        curve.ys = calculated
         curve.label = f"N = {N}"
         curve.color = COLORS[color_index]
         curve.kind = 'scatter'
@@ -78,19 +77,19 @@ if __name__ == '__main__':
         return 1 / (1 + p)
 
     def exponent_original(t: float) -> float:
-        return exp(-t)
+        return np.exp(-t)
 
     def sine_image(p: float) -> float:
         return 1 / (1 + p**2)
 
     def sine_original(t: float) -> float:
-        return sin(t)
+        return np.sin(t)
 
     def damped_sine_image(p: float) -> float:
         return 1 / (1 + (p + 0.2)**2)
 
     def damped_sine_original(t: float) -> float:
-        return exp(-0.2 * t) * sin(t)
+        return np.exp(-0.2 * t) * np.sin(t)
 
     def linear_image(p: float) -> float:
         return 1 / p**2
@@ -102,23 +101,23 @@ if __name__ == '__main__':
         return 1 / (p + 1)**2
 
     def exponent_multiplied_original(t: float) -> float:
-        return t * exp(-t)
+        return t * np.exp(-t)
 
     def rectangular_wave_image(p: float) -> float:
-        return exp(-p) / p
+        return np.exp(-p) / p
 
     def rectangular_wave_origin(t: float) -> float:
-        return 0 if t <= 1 else 1
+        return np.where(t <= 1, 0.0, 1.0)
 
     def rectangular_wave2_origin(t: float) -> float:
-        return 1 if 1 <= t <= 2 else 0
+        return np.where((1 <= t) & (t <= 2), 1.0, 0.0)
 
     def rectangular_wave2_image(p: float) -> float:
-        return (exp(-p) - exp(-(p * 2)))/ p
+        return (np.exp(-p) - np.exp(-(p * 2)))/ p
 
     k = 0.8
     def k0_image(p: float) -> float:
-        return (1 / p) * scipy.special.k0(2 * sqrt(k * p))
+        return (1 / p) * scipy.special.k0(2 * np.sqrt(k * p))
 
     def k0_original(t: float) -> float:
         return 0.5 * scipy.special.exp1(k / t)
@@ -1,4 +1,3 @@
-import math
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.ticker import (MultipleLocator, AutoMinorLocator)
@@ -31,10 +30,10 @@ DEFAULT_CURVE_COLOR     = 'blue'
 DEFAULT_CURVE_WIDTH     = 1.5
 
 class Plotter:
-    def plot(self, data: list[(float, float)], **kwargs) -> None:
+    def plot(self, data: list[(float, float)] | np.ndarray, **kwargs) -> None:
         """
         Plots a simple graph using simple data list.
-        :param data: list of data pairs: (t, f(t)).
+        :param data: list of data pairs: (t, f(t)), or an (N, 2) array of them.
         :param kwargs: Dictionary of plotting parameters.
             Parameters:
             ==========
@@ -101,8 +100,9 @@ class Plotter:
         # Emphasize the x = 0 axis.
         ax.axhline(y=0, color='k', linewidth=0.5)
 
-        x = [t[0] for t in data]
-        y = [t[1] for t in data]
+        points = np.asarray(data, dtype=np.float64).reshape(-1, 2)
+        x = points[:, 0]
+        y = points[:, 1]
 
         # Plot the theoretical curve.
         ax.plot(x, y, linewidth=curve_width, label=label, antialiased=True, color=curve_color)
@@ -113,11 +113,9 @@ class Plotter:
         plt.show()
 
 if __name__ == '__main__':
-    data = []
-
-    for t in np.arange(0, 1.01, 0.01):
-        V = 1.00 * math.exp(-2 * t)
-        data.append((t, V))
+    t = np.arange(0, 1.01, 0.01)
+    V = 1.00 * np.exp(-2 * t)
+    data = np.column_stack((t, V))
 
     plotter = Plotter()
 
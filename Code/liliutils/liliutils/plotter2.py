@@ -2,6 +2,8 @@ import math
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.ticker import (MultipleLocator, AutoMinorLocator)
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 from lilimaths.curve import Curve
 
 #region default values
@@ -60,27 +62,107 @@ class Plotter:
         """
         self._parameters = kwargs
         self._set_defaults()
-        self._prepare_canvas()
+
+        # The canvas is created by the first plotting call.
+        self._figure = None
+        self._ax = None
+        self._background = None
+        self._blit_lines = []
 
     def plot(self, curves = list[Curve]):
         """
         Plots curve graphs for a list of curves.
+        All the line curves are drawn as one LineCollection, the scatter curves as one scatter per marker.
         :param curves: The list of curves.
         :return: None
         """
-        for curve in curves:
-            x = [t[0] for t in curve.values]
-            y = [t[1] for t in curve.values]
+        if self._ax is None:
+            self._prepare_canvas()
+
+        lines = [curve for curve in curves if curve.kind == 'line']
+        scatters = [curve for curve in curves if curve.kind != 'line']
+
+        if lines:
+            segments = [np.column_stack((curve.xs, curve.ys)) for curve in lines]
+            collection = LineCollection(segments, colors=[curve.color for curve in lines],
+                                        linewidths=self._parameters['curve_width'], antialiased=True)
+            self._ax.add_collection(collection, autolim=False)
 
+        for marker in dict.fromkeys(curve.marker for curve in scatters):
+            group = [curve for curve in scatters if curve.marker == marker]
+            counts = [len(curve.xs[::10]) for curve in group]
+            x = np.concatenate([curve.xs[::10] for curve in group])
+            y = np.concatenate([curve.ys[::10] for curve in group])
+            colors = np.repeat([curve.color for curve in group], counts)
+
+            self._ax.scatter(x, y, 80, color=colors, marker=marker, linewidth=0.25, antialiased=True)
+
+        # The collections carry no per-curve labels, so the legend is built from proxy artists.
+        handles = []
+        for curve in curves:
             if curve.kind == 'line':
-                self._ax.plot(x, y, linewidth=self._parameters['curve_width'], label=curve.label, antialiased=True, color=curve.color)
+                handles.append(Line2D([], [], color=curve.color, linewidth=self._parameters['curve_width'], label=curve.label))
             else:
-                self._ax.scatter(x[::10], y[::10], 80, color=curve.color, marker=curve.marker, linewidth=0.25, label=curve.label, antialiased=True)
+                handles.append(Line2D([], [], color=curve.color, marker=curve.marker, markersize=math.sqrt(80),
+                                      linestyle='', label=curve.label))
 
-        self._ax.legend(loc='best')
+        self._ax.legend(handles=handles, loc='best')
 
         plt.show()
 
+    def plot_blit(self, curves: list[Curve]):
+        """
+        Redraws curve graphs over the saved background of the canvas (axes, grid, labels),
+        which is rendered only once. Intended for repeated plotting of changing curves, e.g. animations.
+        The artists of the previous call are reused and re-styled; surplus ones are removed.
+        The first call shows the figure without blocking. This only opens a window with an interactive
+        backend; with a non-interactive one (e.g. Agg) nothing appears, and the figure can be saved instead.
+        :param curves: The list of curves.
+        :return: None
+        """
+        if self._ax is None:
+            self._prepare_canvas()
+
+        canvas = self._figure.canvas
+
+        if self._background is None:
+            plt.show(block=False)
+            canvas.draw()
+            self._background = canvas.copy_from_bbox(self._ax.bbox)
+
+        canvas.restore_region(self._background)
+
+        for line in self._blit_lines[len(curves):]:
+            line.remove()
+
+        del self._blit_lines[len(curves):]
+
+        for index, curve in enumerate(curves):
+            step = 1 if curve.kind == 'line' else 10
+
+            if index < len(self._blit_lines):
+                line = self._blit_lines[index]
+            else:
+                line, = self._ax.plot([], [], animated=True)
+                self._blit_lines.append(line)
+
+            line.set_data(curve.xs[::step], curve.ys[::step])
+            line.set_color(curve.color)
+
+            if curve.kind == 'line':
+                line.set_linestyle('-')
+                line.set_linewidth(self._parameters['curve_width'])
+                line.set_marker('None')
+            else:
+                line.set_linestyle('None')
+                line.set_marker(curve.marker)
+                line.set_markersize(math.sqrt(80))
+
+            self._ax.draw_artist(line)
+
+        canvas.blit(self._ax.bbox)
+        canvas.flush_events()
+
     #region Protected auxiliary
     def _set_defaults(self):
         self._parameters.setdefault('size', DEFAULT_SIZE)
@@ -101,21 +183,25 @@ class Plotter:
         self._parameters.setdefault('curve_color', DEFAULT_CURVE_COLOR)
         self._parameters.setdefault('curve_width', DEFAULT_CURVE_WIDTH)
 
+        self._format_x = f"{{x:.{self._parameters['digits_x']}f}}"
+        self._format_y = f"{{x:.{self._parameters['digits_y']}f}}"
+
     def _prepare_canvas(self):
         plt.rc('figure', figsize=self._parameters['size'])
 
         fig, ax = plt.subplots(1, 1)
 
+        self._figure = fig
         self._ax = ax
 
         ax.set_xlim(self._parameters['min_x'], self._parameters['max_x'])
         ax.xaxis.set_major_locator(MultipleLocator(self._parameters['major_step_x']))
-        ax.xaxis.set_major_formatter(f'{{x:.{self._parameters['digits_x']}f}}')
+        ax.xaxis.set_major_formatter(self._format_x)
         ax.xaxis.set_minor_locator(MultipleLocator(self._parameters['minor_step_x']))
 
         ax.set_ylim(self._parameters['min_y'], self._parameters['max_y'])
         ax.yaxis.set_major_locator(MultipleLocator(self._parameters['major_step_y']))
-        ax.yaxis.set_major_formatter(f'{{x:.{self._parameters['digits_y']}f}}')
+        ax.yaxis.set_major_formatter(self._format_y)
         ax.yaxis.set_minor_locator(MultipleLocator(self._parameters['minor_step_y']))
 
         ax.set_xlabel(self._parameters['label_x'])
@@ -134,23 +220,19 @@ if __name__ == '__main__':
 
     curves = []
 
-    values = []
-    for t in np.arange(0, 2.0, 0.01):
-        values.append((t, t**2))
+    t = np.arange(0, 2.0, 0.01)
 
     curve = Curve()
-    curve.values = values
+    curve.xs = t
+    curve.ys = t**2
     curve.label = 'x^2'
     curve.color = 'green'
 
     curves.append(curve)
 
-    values = []
-    for t in np.arange(0, 2.0, 0.01):
-        values.append((t, (0.85 * t ** 3) * abs(math.sin(3 * t))))
-
     curve = Curve()
-    curve.values = values
+    curve.xs = t
+    curve.ys = (0.85 * t ** 3) * np.abs(np.sin(3 * t))
     curve.label = '0.5 * x^3'
     curve.color = 'red'
 